@@ -4,15 +4,82 @@
     users, bookings, and reviews.
     """
 
+import os
 import random
+from itertools import product
 from datetime import timedelta
+from decimal import Decimal
+import numpy as np
 from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
 from django.utils import timezone
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from listings.models import Listing, Booking, Review
 
+try:
+    from numba import njit
+except ImportError: # Numba is optional; bookings fall back to plain NumPy
+    njit = None
+
 User = get_user_model()
 
+# Rows per INSERT statement for bulk_create; override via the environment
+BATCH_SIZE = int(os.environ.get('SEED_BULK_BATCH', 500))
+
+# Sample values drawn from while seeding
+PROPERTY_TYPES = tuple(choice[0] for choice in Listing.PROPERTY_TYPE_CHOICES)
+CITIES = ('New York', 'London', 'Paris', 'Tokyo', 'Sydney')
+COUNTRIES = ('USA', 'UK', 'France', 'Japan', 'Australia')
+AMENITIES = (("WiFi", "Pool"), ("Gym", "Kitchen"), ("Parking", "Balcony"), ("Pet-Friendly",))
+TITLE_KINDS = ('Cozy Room', 'Spacious Mansion', 'Rustic Cabin')
+DESC_KINDS = ('place', 'villa', 'apartment')
+STATUSES = tuple(choice[0] for choice in Booking.STATUS_CHOICES)
+COMMENTS = (
+    "Great place!", "Highly recommended.", "Clean and cozy.",
+    "Had a wonderful stay.", "Excellent value.",
+)
+
+
+def _generate_bookings_loop(prices_cents, per_listing, seed):
+    """
+    Draws check-in offsets and stay lengths for per_listing bookings of each
+    listing and prices them in integer cents. Written as a plain loop for
+    Numba to compile.
+    """
+    np.random.seed(seed)
+    m = prices_cents.size * per_listing
+    totals = np.empty(m, dtype=np.int64)
+    check_in_offsets = np.empty(m, dtype=np.int64)
+    nights = np.empty(m, dtype=np.int64)
+    for k in range(prices_cents.size):
+        for j in range(per_listing):
+            idx = k * per_listing + j
+            check_in_offsets[idx] = np.random.randint(1, 31)
+            nights[idx] = np.random.randint(2, 8)
+            totals[idx] = prices_cents[k] * nights[idx]
+    return totals, check_in_offsets, nights
+
+
+def _generate_bookings_vectorized(prices_cents, per_listing, seed):
+    """
+    NumPy equivalent of _generate_bookings_loop, used when Numba isn't installed.
+    """
+    rng = np.random.default_rng(seed)
+    m = prices_cents.size * per_listing
+    check_in_offsets = rng.integers(1, 31, m)
+    nights = rng.integers(2, 8, m)
+    totals = np.repeat(prices_cents, per_listing) * nights
+    return totals, check_in_offsets, nights
+
+
+if njit is not None:
+    _generate_bookings = njit(cache=True)(_generate_bookings_loop)
+else:
+    _generate_bookings = _generate_bookings_vectorized
+
+
 class Command(BaseCommand):
         """
         Management command to seed the database with sample data.
@@ -58,121 +125,187 @@ class Command(BaseCommand):
             Handles the execution of the seed command.
             """
             self.stdout.write(self.style.NOTICE("Starting database seeding..."))
+            # Per-row output is unstyled and only written at verbosity 2 or higher
+            verbose = options['verbosity'] >= 2
 
             if options['clear']:
                 self.stdout.write(self.style.WARNING("Clearing existing data..."))
-                Review.objects.all().delete()
-                Booking.objects.all().delete()
-                Listing.objects.all().delete()
+                # Truncate in one statement batch instead of collecting every row for cascades;
+                # sql_flush builds the TRUNCATE statements for the active backend (FK checks off on MySQL)
+                tables = [model._meta.db_table for model in (Review, Booking, Listing)]
+                connection.ops.execute_sql_flush(connection.ops.sql_flush(no_style(), tables, reset_sequences=True))
                 User.objects.filter(is_superuser=False).delete() # Only delete non-superusers
                 self.stdout.write(self.style.SUCCESS("Existing data cleared."))
 
-            num_users = options['num_users']
-            num_listings_per_host = options['num_listings_per_host']
-            num_bookings_per_listing = options['num_bookings_per_listing']
-            num_reviews_per_listing = options['num_reviews_per_listing']
-
-            # Create sample users (some hosts, some guests)
-            self.stdout.write(self.style.NOTICE(f"Creating {num_users} sample users..."))
-            users = []
-            for i in range(num_users):
-                email = f"user{i}@example.com"
-                if not User.objects.filter(email=email).exists():
-                    user = User.objects.create_user(
+            # Negative counts mean nothing to create; the pre-drawn arrays can't be negative-sized
+            num_users = max(0, options['num_users'])
+            num_listings_per_host = max(0, options['num_listings_per_host'])
+            num_bookings_per_listing = max(0, options['num_bookings_per_listing'])
+            num_reviews_per_listing = max(0, options['num_reviews_per_listing'])
+
+            # Seed everything in one transaction so the database commits once
+            with transaction.atomic(savepoint=False):
+                # Create sample users (some hosts, some guests)
+                self.stdout.write(self.style.NOTICE(f"Creating {num_users} sample users..."))
+                emails = [f"user{i}@example.com" for i in range(num_users)]
+                existing = set(
+                    User.objects.filter(email__in=emails).values_list('email', flat=True)
+                )
+                # All sample users share one password, so hash it only once
+                hashed = make_password("password123")
+                roles = random.choices(('guest', 'host'), k=num_users)
+                new_users = [
+                    User(
                         username=f"user{i}",
                         email=email,
-                        password="password123",
+                        password=hashed,
                         first_name=f"First{i}",
                         last_name=f"Last{i}",
-                        role=random.choice(['guest', 'host'])
+                        role=roles[i]
                     )
-                    users.append(user)
-                    self.stdout.write(self.style.SUCCESS(f"Created user: {user.email} ({user.role})"))
-                else:
-                    users.append(User.objects.get(email=email))
-                    self.stdout.write(self.style.WARNING(f"User {email} already exists, skipping creation."))
-
-            hosts = [u for u in users if u.role == 'host']
-            guests = [u for u in users if u.role == 'guest']
-
-            if not hosts:
-                self.stdout.write(self.style.WARNING("No hosts created. Creating at least one host for listings."))
-                host = User.objects.create_user(
-                    username="auto_host",
-                    email="auto_host@example.com",
-                    password="password123",
-                    first_name="Auto",
-                    last_name="Host",
-                    role="host"
+                    for i, email in enumerate(emails)
+                    if email not in existing
+                ]
+                User.objects.bulk_create(new_users, batch_size=BATCH_SIZE)
+                if verbose:
+                    for user in new_users:
+                        self.stdout.write(f"Created user: {user.email} ({user.role})")
+                    for email in existing:
+                        self.stdout.write(f"User {email} already exists, skipping creation.")
+                self.stdout.write(self.style.SUCCESS(f"Created {len(new_users)} users."))
+                if existing:
+                    self.stdout.write(self.style.WARNING(f"{len(existing)} users already exist, skipping creation."))
+                # bulk_create does not hand back auto-increment PKs on MySQL, so reload.
+                # Stream the rows in chunks, loading only the columns the seed reads.
+                hosts = []
+                guests = []
+                sample_users = User.objects.filter(email__in=emails).only(
+                    'id', 'email', 'first_name', 'role'
                 )
-                hosts.append(host)
-                users.append(host) # Add to general users list too
-
-            # Create sample listings
-            self.stdout.write(self.style.NOTICE("Creating sample listings..."))
-            listings = []
-            for host in hosts:
-                for i in range(num_listings_per_host):
-                    listing = Listing.objects.create(
+                for user in sample_users.iterator(chunk_size=BATCH_SIZE):
+                    if user.role == 'host':
+                        hosts.append(user)
+                    elif user.role == 'guest':
+                        guests.append(user)
+
+                if not hosts:
+                    self.stdout.write(self.style.WARNING("No hosts created. Creating at least one host for listings."))
+                    host = User(
+                        username="auto_host",
+                        email="auto_host@example.com",
+                        password=hashed, # Reuse the hash computed for the sample users
+                        first_name="Auto",
+                        last_name="Host",
+                        role="host"
+                    )
+                    host.save()
+                    hosts.append(host)
+
+                # Create sample listings
+                self.stdout.write(self.style.NOTICE("Creating sample listings..."))
+                # Draw all the randomness for a section in one call per field: numbers
+                # as NumPy arrays, sample values with random.choices so they stay str
+                rng = np.random.default_rng()
+                n = len(hosts) * num_listings_per_host
+                title_kinds = random.choices(TITLE_KINDS, k=n)
+                desc_kinds = random.choices(DESC_KINDS, k=n)
+                desc_cities = random.choices(CITIES, k=n)
+                street_numbers = rng.integers(1, 101, n)
+                cities = random.choices(CITIES, k=n)
+                countries = random.choices(COUNTRIES, k=n)
+                # Prices stay in integer cents until they are handed to the models
+                prices_cents = np.rint(rng.uniform(50.00, 500.00, n) * 100).astype(np.int64)
+                property_types = random.choices(PROPERTY_TYPES, k=n)
+                bedrooms = rng.integers(1, 6, n)
+                bathrooms = rng.integers(1, 4, n)
+                max_guests = rng.integers(1, 11, n)
+                amenity_sets = random.choices(AMENITIES, k=n)
+                # NumPy scalars are unwrapped so the DB driver gets plain Python types
+                listings = [
+                    Listing(
                         host=host,
-                        title=f"{host.first_name}'s {random.choice(['Cozy Room', 'Spacious Mansion', 'Rustic Cabin'])} {i+1}",
-                        description=f"A beautiful {random.choice(['place', 'villa', 'apartment'])} in {random.choice(['New York', 'London', 'Paris', 'Tokyo', 'Sydney'])}.",
-                        address=f"{random.randint(1, 100)} Main St",
-                        city=random.choice(['New York', 'London', 'Paris', 'Tokyo', 'Sydney']),
-                        country=random.choice(['USA', 'UK', 'France', 'Japan', 'Australia']),
-                        price_per_night=random.uniform(50.00, 500.00),
-                        property_type=random.choice([choice[0] for choice in Listing.PROPERTY_TYPE_CHOICES]),
-                        num_bedrooms=random.randint(1, 5),
-                        num_bathrooms=random.randint(1, 3),
-                        max_guests=random.randint(1, 10),
-                        amenities=random.choice(["WiFi, Pool", "Gym, Kitchen", "Parking, Balcony", "Pet-Friendly"]),
+                        title=f"{host.first_name}'s {title_kinds[k]} {i+1}",
+                        description=f"A beautiful {desc_kinds[k]} in {desc_cities[k]}.",
+                        address=f"{street_numbers[k]} Main St",
+                        city=cities[k],
+                        country=countries[k],
+                        price_per_night=Decimal(int(prices_cents[k])) / 100,
+                        property_type=property_types[k],
+                        num_bedrooms=int(bedrooms[k]),
+                        num_bathrooms=int(bathrooms[k]),
+                        max_guests=int(max_guests[k]),
+                        amenities=list(amenity_sets[k]),
                     )
-                    listings.append(listing)
-                    self.stdout.write(self.style.SUCCESS(f"Created listing: {listing.title} by {host.email}"))
-
-            # Create sample bookings
-            self.stdout.write(self.style.NOTICE("Creating sample bookings..."))
-            for listing in listings:
-                for i in range(num_bookings_per_listing):
-                    if guests:
-                        guest = random.choice(guests)
-                        check_in = timezone.now().date() + timedelta(days=random.randint(1, 30))
-                        check_out = check_in + timedelta(days=random.randint(2, 7))
-                        total_price = listing.price_per_night * (check_out - check_in).days
-                        booking = Booking.objects.create(
+                    for k, (host, i) in enumerate(product(hosts, range(num_listings_per_host)))
+                ]
+
+                # Create sample bookings
+                self.stdout.write(self.style.NOTICE("Creating sample bookings..."))
+                bookings = []
+                if guests:
+                    m = len(listings) * num_bookings_per_listing
+                    booking_guests = random.choices(guests, k=m)
+                    # Listings were built in order, so prices_cents[k] belongs to listings[k]
+                    totals_cents, check_in_offsets, stay_lengths = _generate_bookings(
+                        prices_cents, num_bookings_per_listing, int(rng.integers(2**31))
+                    )
+                    statuses = random.choices(STATUSES, k=m)
+                    today = timezone.now().date()
+                    for k, (listing, i) in enumerate(product(listings, range(num_bookings_per_listing))):
+                        nights = int(stay_lengths[k])
+                        check_in = today + timedelta(days=int(check_in_offsets[k]))
+                        check_out = check_in + timedelta(days=nights)
+                        bookings.append(Booking(
                             property=listing,
-                            user=guest,
+                            user=booking_guests[k],
                             check_in_date=check_in,
                             check_out_date=check_out,
-                            total_price=total_price,
-                            status=random.choice(['pending', 'confirmed', 'canceled'])
-                        )
-                        self.stdout.write(self.style.SUCCESS(f"Created booking for {listing.title} by {guest.email}"))
-                    else:
-                        self.stdout.write(self.style.WARNING(f"No guest users available to create booking for {listing.title}"))
-
-            # Create sample reviews
-            self.stdout.write(self.style.NOTICE("Creating sample reviews..."))
-            for listing in listings:
-                for i in range(num_reviews_per_listing):
-                    if guests:
-                        reviewer = random.choice(guests)
+                            total_price=Decimal(int(totals_cents[k])) / 100,
+                            status=statuses[k]
+                        ))
+                else:
+                    self.stdout.write(self.style.WARNING("No guest users available to create bookings."))
+
+                # Create sample reviews
+                self.stdout.write(self.style.NOTICE("Creating sample reviews..."))
+                reviews = []
+                # The listings are new, so only pairs drawn in this run can collide
+                reviewed = set()
+                if guests:
+                    m = len(listings) * num_reviews_per_listing
+                    reviewers = random.choices(guests, k=m)
+                    ratings = random.choices(range(1, 6), k=m)
+                    comments = random.choices(COMMENTS, k=m)
+                    for k, (listing, i) in enumerate(product(listings, range(num_reviews_per_listing))):
+                        reviewer = reviewers[k]
                         # Ensure a user doesn't review the same property multiple times
-                        if not Review.objects.filter(property=listing, user=reviewer).exists():
-                            review = Review.objects.create(
-                                property=listing,
-                                user=reviewer,
-                                rating=random.randint(1, 5),
-                                comment=random.choice([
-                                    "Great place!", "Highly recommended.", "Clean and cozy.",
-                                    "Had a wonderful stay.", "Excellent value."
-                                ])
-                            )
-                            self.stdout.write(self.style.SUCCESS(f"Created review for {listing.title} by {reviewer.email}"))
-                        else:
-                            self.stdout.write(self.style.WARNING(f"User {reviewer.email} already reviewed {listing.title}, skipping."))
-                    else:
-                        self.stdout.write(self.style.WARNING(f"No guest users available to create review for {listing.title}"))
+                        if (listing.pk, reviewer.pk) in reviewed:
+                            continue
+                        reviewed.add((listing.pk, reviewer.pk))
+                        reviews.append(Review(
+                            property=listing,
+                            user=reviewer,
+                            rating=ratings[k],
+                            comment=comments[k]
+                        ))
+                else:
+                    self.stdout.write(self.style.WARNING("No guest users available to create reviews."))
+
+                # listing_id is a client-side UUID, so bookings and reviews can reference
+                # the listings before they are inserted
+                Listing.objects.bulk_create(listings, batch_size=BATCH_SIZE)
+                Booking.objects.bulk_create(bookings, batch_size=BATCH_SIZE)
+                Review.objects.bulk_create(reviews, batch_size=BATCH_SIZE, ignore_conflicts=True)
 
+            if verbose:
+                for listing in listings:
+                    self.stdout.write(f"Created listing: {listing.title} by {listing.host.email}")
+                for booking in bookings:
+                    self.stdout.write(f"Created booking for {booking.property.title} by {booking.user.email}")
+                for review in reviews:
+                    self.stdout.write(f"Created review for {review.property.title} by {review.user.email}")
+            self.stdout.write(self.style.SUCCESS(f"Created {len(listings)} listings."))
+            self.stdout.write(self.style.SUCCESS(f"Created {len(bookings)} bookings."))
+            self.stdout.write(self.style.SUCCESS(f"Created {len(reviews)} reviews."))
 
             self.stdout.write(self.style.SUCCESS("Database seeding completed successfully!"))
@@ -1,5 +1,5 @@
 # listings/models.py
-import uuid
+from uuid6 import uuid7
 from django.db import models
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
@@ -10,9 +10,8 @@ class Listing(models.Model):
         """
         listing_id = models.UUIDField(
             primary_key=True,
-            default=uuid.uuid4,
+            default=uuid7,
             editable=False,
-            db_index=True,
             verbose_name=_('Listing ID')
         )
         # Foreign Key to the User model (host of the property)
@@ -50,7 +49,7 @@ class Listing(models.Model):
         num_bedrooms = models.IntegerField(null=False, blank=False, verbose_name=_('Number of Bedrooms'))
         num_bathrooms = models.IntegerField(null=False, blank=False, verbose_name=_('Number of Bathrooms'))
         max_guests = models.IntegerField(null=False, blank=False, verbose_name=_('Maximum Guests'))
-        amenities = models.TextField(blank=True, verbose_name=_('Amenities')) # Store as comma-separated string or JSON
+        amenities = models.JSONField(default=list, blank=True, verbose_name=_('Amenities')) # List of amenity names
         created_at = models.DateTimeField(auto_now_add=True, verbose_name=_('Created At'))
         updated_at = models.DateTimeField(auto_now=True, verbose_name=_('Updated At'))
 
@@ -69,9 +68,8 @@ class Booking(models.Model):
         """
         booking_id = models.UUIDField(
             primary_key=True,
-            default=uuid.uuid4,
+            default=uuid7,
             editable=False,
-            db_index=True,
             verbose_name=_('Booking ID')
         )
         # Foreign Key to the Listing model
@@ -114,6 +112,10 @@ class Booking(models.Model):
             verbose_name = _('Booking')
             verbose_name_plural = _('Bookings')
             db_table = 'bookings'
+            indexes = [
+                models.Index(fields=['property', 'check_in_date'], name='booking_property_checkin_idx'),
+                models.Index(fields=['user', 'status'], name='booking_user_status_idx'),
+            ]
 
 
         def __str__(self):
@@ -126,9 +128,8 @@ class Review(models.Model):
         """
         review_id = models.UUIDField(
             primary_key=True,
-            default=uuid.uuid4,
+            default=uuid7,
             editable=False,
-            db_index=True,
             verbose_name=_('Review ID')
         )
         # Foreign Key to the Listing model
@@ -161,6 +162,10 @@ class Review(models.Model):
             db_table = 'reviews'
 
             unique_together = ('property', 'user')
+            indexes = [
+                # Matches the newest-first ordering used by ListingSerializer.get_reviews
+                models.Index(fields=['property', '-created_at'], name='review_property_created_idx'),
+            ]
 
         def __str__(self):
             """String representation of the Review model."""
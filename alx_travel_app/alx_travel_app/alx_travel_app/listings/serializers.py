@@ -3,6 +3,7 @@
     Serializers for the listings application models.
     """
 
+from operator import attrgetter
 from rest_framework import serializers
 from .models import Listing, Booking, Review # Import all models
 from django.contrib.auth import get_user_model
@@ -20,6 +21,20 @@ class UserSerializer(serializers.ModelSerializer):
             fields = ('id', 'first_name', 'last_name', 'email')
             read_only_fields = ('id', 'email')
 
+        @classmethod
+        def apply_optimal_select(cls, queryset, user_field='user'):
+            """
+            Joins the related user on the queryset and defers every user column
+            this serializer doesn't expose (password hash, last_login, ...).
+            Use it in views whose serializer nests UserSerializer.
+            """
+            deferred = [
+                f"{user_field}__{field.name}"
+                for field in User._meta.concrete_fields
+                if field.name not in cls.Meta.fields
+            ]
+            return queryset.select_related(user_field).defer(*deferred)
+
 
 class ListingSerializer(serializers.ModelSerializer):
         """
@@ -35,6 +50,15 @@ class ListingSerializer(serializers.ModelSerializer):
         reviews = serializers.SerializerMethodField()
 
         class Meta:
+            # Views should prefetch reviews (with their users, which ReviewSerializer
+            # nests) so get_reviews doesn't query per listing:
+            # queryset.prefetch_related(Prefetch(
+            #     'reviews',
+            #     queryset=UserSerializer.apply_optimal_select(
+            #         Review.objects.order_by('-created_at')
+            #     ),
+            #     to_attr='_prefetched_reviews',
+            # ))
             model = Listing
             fields = (
                 'listing_id', 'host', 'host_id', 'title', 'description',
@@ -52,17 +76,38 @@ class ListingSerializer(serializers.ModelSerializer):
         def get_reviews(self, obj):
             """
             Returns serialized reviews for the listing.
+            Uses the prefetched reviews when the view supplied them.
             """
-            reviews = obj.reviews.all().order_by('-created_at')
-            return ReviewSerializer(reviews, many=True).data
+            reviews = getattr(obj, '_prefetched_reviews', None)
+            if reviews is None:
+                if 'reviews' in getattr(obj, '_prefetched_objects_cache', {}):
+                    # A plain prefetch_related('reviews'); order_by() would discard
+                    # the cache and query again, so sort the cached list instead
+                    reviews = sorted(
+                        obj.reviews.all(), key=attrgetter('created_at'), reverse=True
+                    )
+                else:
+                    reviews = obj.reviews.all().order_by('-created_at')
+            return ReviewSerializer(reviews, many=True, context=self.context).data
+
+
+class PropertyMiniSerializer(serializers.ModelSerializer):
+        """
+        Serializer for a simplified representation of a Listing.
+        Used to represent the property in bookings.
+        """
+        class Meta:
+            model = Listing
+            fields = ('listing_id', 'title', 'city', 'country', 'price_per_night')
 
 
 class BookingSerializer(serializers.ModelSerializer):
         """
         Serializer for the Booking model.
         Includes nested property and user information for read operations.
+        Views should use Booking.objects.select_related('property', 'user').
         """
-        property = serializers.SerializerMethodField() # Custom representation of property
+        property = PropertyMiniSerializer(read_only=True) # Simplified property details
         user = UserSerializer(read_only=True) # Nested serializer for user details
         # For creating/updating, accept IDs directly
         property_id = serializers.PrimaryKeyRelatedField(
@@ -87,18 +132,6 @@ class BookingSerializer(serializers.ModelSerializer):
                 'user_id': {'write_only': True},
             }
 
-        def get_property(self, obj):
-            """
-            Returns a simplified representation of the associated property.
-            """
-            return {
-                'listing_id': obj.property.listing_id,
-                'title': obj.property.title,
-                'city': obj.property.city,
-                'country': obj.property.country,
-                'price_per_night': obj.property.price_per_night
-            }
-
 
 class ReviewSerializer(serializers.ModelSerializer):
         """